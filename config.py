@@ -22,13 +22,13 @@ data_paths = {
 }
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class PretrainConfig(BaseConfig):
     name: str
     path: str
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class TrainConfig(BaseConfig):
     # random seed
     seed: int = 0
@@ -22,7 +22,7 @@ import torch.nn.functional as F
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class GaussianDiffusionBeatGansConfig(BaseConfig):
     gen_type: GenerativeType
     betas: Tuple[float]
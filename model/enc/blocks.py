@@ -14,7 +14,7 @@ from .nn import (avg_pool_nd, conv_nd, linear, normalization,
                  timestep_embedding, torch_checkpoint, zero_module)
 
 
-class ScaleAt(Enum):
+class ScaleAt(str, Enum):
     after_norm = 'afternorm'
 
 
@@ -43,7 +43,7 @@ class TimestepEmbedSequential(nn.Sequential, TimestepBlock):
         return x
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ResBlockConfig(BaseConfig):
     channels: int
     emb_channels: int
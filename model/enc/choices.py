@@ -2,7 +2,7 @@ from enum import Enum
 from torch import nn
 
 
-class TrainMode(Enum):
+class TrainMode(str, Enum):
     # 定義訓練模式的枚舉類型，用於控制訓練過程中的行為
 
     # manipulate 模式：訓練分類器的模式，通常用於目標操作的任務
@@ -20,9 +20,7 @@ class TrainMode(Enum):
         Returns:
             bool: 如果模式為 manipulate，返回 True，否則返回 False
         """
-        return self in [
-            TrainMode.manipulate,
-        ]
+        return self is TrainMode.manipulate
 
     def is_diffusion(self):
         """
@@ -30,10 +28,7 @@ class TrainMode(Enum):
         Returns:
             bool: 如果是擴散模式，返回 True，否則返回 False
         """
-        return self in [
-            TrainMode.diffusion,
-            TrainMode.latent_diffusion,
-        ]
+        return self in _DIFFUSION_MODES
 
     def is_autoenc(self):
         """
@@ -41,9 +36,7 @@ class TrainMode(Enum):
         Returns:
             bool: 如果可能涉及自動編碼（例如 diffusion 模式），返回 True，否則返回 False
         """
-        return self in [
-            TrainMode.diffusion,
-        ]
+        return self is TrainMode.diffusion
 
     def is_latent_diffusion(self):
         """
@@ -51,9 +44,7 @@ class TrainMode(Enum):
         Returns:
             bool: 如果模式為 latent_diffusion，返回 True，否則返回 False
         """
-        return self in [
-            TrainMode.latent_diffusion,
-        ]
+        return self is TrainMode.latent_diffusion
 
     def use_latent_net(self):
         """
@@ -71,13 +62,10 @@ class TrainMode(Enum):
         """
         # 在這些模式下會提前計算潛在變量
         # 數據集將包含所有預測的潛在變量
-        return self in [
-            TrainMode.latent_diffusion,
-            TrainMode.manipulate,
-        ]
+        return self in _REQUIRE_INFER_MODES
 
 
-class ManipulateMode(Enum):
+class ManipulateMode(str, Enum):
     """
     定義操作模式（ManipulateMode）枚舉，用於控制如何訓練分類器以進行目標操作。
     """
@@ -97,11 +85,7 @@ class ManipulateMode(Enum):
         Returns:
             bool: 如果模式是基於 CelebA 的操作，返回 True，否則返回 False。
         """
-        return self in [
-            ManipulateMode.d2c_fewshot,
-            ManipulateMode.d2c_fewshot_allneg,
-            ManipulateMode.celebahq_all,
-        ]
+        return self in _CELEBA_ATTR_MODES
 
     def is_single_class(self):
         """
@@ -109,10 +93,7 @@ class ManipulateMode(Enum):
         Returns:
             bool: 如果是單一分類器模式，返回 True，否則返回 False。
         """
-        return self in [
-            ManipulateMode.d2c_fewshot,
-            ManipulateMode.d2c_fewshot_allneg,
-        ]
+        return self in _FEWSHOT_MODES
 
     def is_fewshot(self):
         """
@@ -120,10 +101,7 @@ class ManipulateMode(Enum):
         Returns:
             bool: 如果是小樣本訓練模式，返回 True，否則返回 False。
         """
-        return self in [
-            ManipulateMode.d2c_fewshot,
-            ManipulateMode.d2c_fewshot_allneg,
-        ]
+        return self in _FEWSHOT_MODES
 
     def is_fewshot_allneg(self):
         """
@@ -131,12 +109,10 @@ class ManipulateMode(Enum):
         Returns:
             bool: 如果是僅負樣本的小樣本模式，返回 True，否則返回 False。
         """
-        return self in [
-            ManipulateMode.d2c_fewshot_allneg,
-        ]
+        return self is ManipulateMode.d2c_fewshot_allneg
 
 
-class ModelType(Enum):
+class ModelType(str, Enum):
     """
     Kinds of the backbone models
     """
@@ -147,15 +123,13 @@ class ModelType(Enum):
     autoencoder = 'autoencoder'
 
     def has_autoenc(self):
-        return self in [
-            ModelType.autoencoder,
-        ]
+        return self is ModelType.autoencoder
 
     def can_sample(self):
-        return self in [ModelType.ddpm]
+        return self is ModelType.ddpm
 
 
-class ModelName(Enum):
+class ModelName(str, Enum):
     """
     List of all supported model classes
     """
@@ -164,7 +138,7 @@ class ModelName(Enum):
     beatgans_autoenc = 'beatgans_autoenc'
 
 
-class ModelMeanType(Enum):
+class ModelMeanType(str, Enum):
     """
     Which type of output the model predicts.
     """
@@ -172,7 +146,7 @@ class ModelMeanType(Enum):
     eps = 'eps'  # the model predicts epsilon
 
 
-class ModelVarType(Enum):
+class ModelVarType(str, Enum):
     """
     定義了模型預測的方差類型
     What is used as the model's output variance.
@@ -187,12 +161,12 @@ class ModelVarType(Enum):
     fixed_large = 'fixed_large' # 大的固定方差：這是模型使用一個較大的固定方差進行處理，通常用於更高階的擴散過程。
 
 
-class LossType(Enum):
+class LossType(str, Enum):
     mse = 'mse'  # use raw MSE loss (and KL when learning variances)
     l1 = 'l1'
 
 
-class GenerativeType(Enum):
+class GenerativeType(str, Enum):
     """
     How's a sample generated
     """
@@ -201,12 +175,12 @@ class GenerativeType(Enum):
     ddim = 'ddim'
 
 
-class OptimizerType(Enum):
+class OptimizerType(str, Enum):
     adam = 'adam'
     adamw = 'adamw'
 
 
-class Activation(Enum):
+class Activation(str, Enum):
     none = 'none'
     relu = 'relu'
     lrelu = 'lrelu'
@@ -214,20 +188,40 @@ class Activation(Enum):
     tanh = 'tanh'
 
     def get_act(self):
-        if self == Activation.none:
-            return nn.Identity()
-        elif self == Activation.relu:
-            return nn.ReLU()
-        elif self == Activation.lrelu:
-            return nn.LeakyReLU(negative_slope=0.2)
-        elif self == Activation.silu:
-            return nn.SiLU()
-        elif self == Activation.tanh:
-            return nn.Tanh()
-        else:
-            raise NotImplementedError()
-
-
-class ManipulateLossType(Enum):
+        return _ACT_SINGLETONS[self]
+
+
+# 這些激活層沒有參數與緩衝區，可在各模組間共用同一實例
+# 不使用 inplace：latentnet 的 cond_layers 會對多層共用的 cond 張量套用激活
+_ACT_SINGLETONS = {
+    Activation.none: nn.Identity(),
+    Activation.relu: nn.ReLU(),
+    Activation.lrelu: nn.LeakyReLU(negative_slope=0.2),
+    Activation.silu: nn.SiLU(),
+    Activation.tanh: nn.Tanh(),
+}
+
+
+class ManipulateLossType(str, Enum):
     bce = 'bce'
-    mse = 'mse'
\ No newline at end of file
+    mse = 'mse'
+
+
+# 多成員判斷所用的集合，只在導入時建立一次
+_DIFFUSION_MODES = frozenset({
+    TrainMode.diffusion,
+    TrainMode.latent_diffusion,
+})
+_REQUIRE_INFER_MODES = frozenset({
+    TrainMode.latent_diffusion,
+    TrainMode.manipulate,
+})
+_FEWSHOT_MODES = frozenset({
+    ManipulateMode.d2c_fewshot,
+    ManipulateMode.d2c_fewshot_allneg,
+})
+_CELEBA_ATTR_MODES = frozenset({
+    ManipulateMode.d2c_fewshot,
+    ManipulateMode.d2c_fewshot_allneg,
+    ManipulateMode.celebahq_all,
+})
@@ -1,15 +1,48 @@
+import copy
 import json
 import os
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from enum import Enum
 
-@dataclass
+import numpy as np
+
+@dataclass(slots=True)
 class BaseConfig:
-    """基礎配置類，提供配置的複製、繼承、存儲和加載功能"""
+    """
+    基礎配置類，提供配置的複製、繼承、存儲和加載功能
+    - 以欄位值判斷相等並計算雜湊，可作為快取的鍵；用作鍵之後不應再修改
+    - 子類需以 eq=False 宣告，否則 dataclass 會覆蓋 __eq__ 並移除 __hash__；
+      首次使用該子類時會檢查，違反即拋出 TypeError
+    """
+
+    def _key(self):
+        return tuple(
+            (k, _freeze(getattr(self, k))) for k in _field_names(type(self)))
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash((type(self), self._key()))
 
     def clone(self):
-        """深拷貝當前配置，返回一個新副本"""
-        return deepcopy(self)
+        """
+        複製當前配置，返回一個新副本
+        - 子配置（BaseConfig）遞歸複製，容器只複製一層，numpy 陣列複製，其餘值直接共用
+        """
+        new = object.__new__(type(self))  # 跳過 __init__ 與 __post_init__
+        for k in _field_names(type(self)):
+            v = getattr(self, k)
+            if isinstance(v, BaseConfig):  # 子配置遞歸複製
+                v = v.clone()
+            elif isinstance(v, (list, dict, set)):  # 可變容器複製一層
+                v = copy.copy(v)
+            elif isinstance(v, np.ndarray):  # 陣列亦可原地修改，需複製
+                v = v.copy()
+            setattr(new, k, v)
+        return new
 
     def inherit(self, another):
         """
@@ -17,19 +50,24 @@ class BaseConfig:
         - 只會覆蓋共同鍵（key）的值
         :param another: 另一個 BaseConfig 對象
         """
-        common_keys = set(self.__dict__.keys()) & set(another.__dict__.keys())  # 獲取共有鍵
-        for k in common_keys:
-            setattr(self, k, getattr(another, k))  # 設置繼承的值
+        own_keys = _field_types(type(self))
+        for k in _field_names(type(another)):
+            if k in own_keys:  # 只處理共有鍵
+                setattr(self, k, getattr(another, k))  # 設置繼承的值
 
     def propagate(self):
         """
         將當前配置的屬性值向下傳遞到其成員（如果成員是 BaseConfig 的子類）
-        - 遞歸地繼承父配置中的值
+        - 以顯式堆疊逐層繼承父配置中的值，避免遞歸呼叫
         """
-        for k, v in self.__dict__.items():
-            if isinstance(v, BaseConfig):  # 如果成員屬性是 BaseConfig 類型
-                v.inherit(self)  # 繼承父層的公共屬性
-                v.propagate()  # 繼續向下傳遞
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            for k in _field_names(type(node)):
+                v = getattr(node, k)
+                if isinstance(v, BaseConfig):  # 如果成員屬性是 BaseConfig 類型
+                    v.inherit(node)  # 繼承父層的公共屬性
+                    stack.append(v)  # 稍後繼續向下傳遞
 
     def save(self, save_path):
         """
@@ -37,19 +75,19 @@ class BaseConfig:
         :param save_path: 文件保存路徑
         """
         dirname = os.path.dirname(save_path)
-        if not os.path.exists(dirname):  # 如果目錄不存在，創建它
-            os.makedirs(dirname)
+        if dirname:  # 如果目錄不存在，創建它
+            os.makedirs(dirname, exist_ok=True)
         conf = self.as_dict_jsonable()  # 將配置轉為可序列化的字典
-        with open(save_path, 'w') as f:  # 打開文件並保存
-            json.dump(conf, f)
+        with open(save_path, 'wb') as f:  # 打開文件並保存
+            f.write(_dumps(conf))
 
     def load(self, load_path):
         """
         從 JSON 文件加載配置並更新當前對象
         :param load_path: JSON 文件的路徑
         """
-        with open(load_path) as f:  # 打開文件並加載配置
-            conf = json.load(f)
+        with open(load_path, 'rb') as f:  # 打開文件並加載配置
+            conf = _loads(f.read())
         self.from_dict(conf)  # 使用加載的字典更新當前配置
 
     def from_dict(self, dict, strict=False):
@@ -58,17 +96,23 @@ class BaseConfig:
         :param dict: 要應用的字典
         :param strict: 嚴格模式，如果遇到多餘的鍵，則拋出錯誤
         """
+        field_types = _field_types(type(self))
         for k, v in dict.items():
-            if not hasattr(self, k):  # 當前配置中不存在該鍵
+            if k not in field_types:  # 當前配置中不存在該鍵
                 if strict:
                     raise ValueError(f"loading extra '{k}'")  # 嚴格模式下報錯
                 else:
                     print(f"loading extra '{k}'")  # 提示加載了多餘的鍵
                     continue
-            if isinstance(self.__dict__[k], BaseConfig):  # 如果屬性是 BaseConfig 類型
-                self.__dict__[k].from_dict(v)  # 遞歸更新子配置
+            cur = getattr(self, k)
+            if isinstance(cur, BaseConfig):  # 如果屬性是 BaseConfig 類型
+                cur.from_dict(v)  # 遞歸更新子配置
             else:
-                self.__dict__[k] = v  # 更新值
+                t = field_types[k]
+                if (v is not None and isinstance(t, type)
+                        and issubclass(t, Enum)):  # 將存檔中的值還原為枚舉成員
+                    v = t(v)
+                setattr(self, k, v)  # 更新值
 
     def as_dict_jsonable(self):
         """
@@ -77,22 +121,98 @@ class BaseConfig:
         :return: 可序列化的字典
         """
         conf = {}
-        for k, v in self.__dict__.items():
-            if isinstance(v, BaseConfig):  # 如果是 BaseConfig 類型
-                conf[k] = v.as_dict_jsonable()  # 遞歸轉換子配置
-            else:
-                if jsonable(v):  # 檢查是否可序列化
-                    conf[k] = v
-                else:
-                    # 忽略不可序列化的屬性
-                    pass
+        for k in _field_names(type(self)):
+            v = _to_jsonable(getattr(self, k))
+            if v is not _SKIP:  # 忽略不可序列化的屬性
+                conf[k] = v
         return conf
 
 
+def _field_types(cls):
+    """
+    每個配置類的欄位名稱與類型，首次使用時由 fields() 計算並存於該類別本身
+    - 只讀取 cls.__dict__，避免沿用父類的快取；與子類的宣告方式無關
+    """
+    types = cls.__dict__.get('_FIELDTYPES')
+    if types is None:
+        if (cls.__eq__ is not BaseConfig.__eq__
+                or cls.__hash__ is not BaseConfig.__hash__):
+            # dataclass 預設 eq=True 會生成 __eq__ 並將 __hash__ 設為 None
+            raise TypeError(
+                f"{cls.__name__} must be declared with @dataclass(eq=False) "
+                "to keep BaseConfig's __eq__/__hash__")
+        types = {f.name: f.type for f in fields(cls)}
+        cls._FIELDTYPES = types
+        cls._FIELDNAMES = tuple(types)  # 依定義順序
+    return types
+
+
+def _field_names(cls):
+    names = cls.__dict__.get('_FIELDNAMES')
+    if names is None:
+        _field_types(cls)
+        names = cls._FIELDNAMES
+    return names
+
+
+def _freeze(v):
+    """將值轉為可雜湊的形式，遞歸處理子配置、容器與 numpy 陣列"""
+    if isinstance(v, BaseConfig):
+        return (type(v), v._key())
+    if isinstance(v, np.ndarray):  # 例如 GaussianDiffusionBeatGansConfig.betas
+        return (v.dtype.str, v.shape, v.tobytes())
+    if isinstance(v, (list, tuple)):
+        return tuple(_freeze(x) for x in v)
+    if isinstance(v, dict):
+        return frozenset((k, _freeze(x)) for k, x in v.items())
+    if isinstance(v, set):
+        return frozenset(_freeze(x) for x in v)
+    return v
+
+
+def _dumps(obj):
+    """序列化為緊湊的 JSON bytes；NaN/inf 照標準庫 json 寫為 NaN/Infinity"""
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(data):
+    return json.loads(data)
+
+
+_JSONABLE_TYPES = (int, float, str, bool, type(None))
+_SKIP = object()  # 標記不可序列化的值
+
 
-def jsonable(x):
-    try:
-        json.dumps(x)
-        return True
-    except TypeError:
-        return False
+def _to_jsonable(v):
+    """
+    按已知類型逐一轉換為 JSON 可序列化的值，不做 json.dumps 試探
+    - 容器中任一元素不可序列化時，整個容器都會被忽略
+    :return: 可序列化的值，或 _SKIP
+    """
+    if isinstance(v, BaseConfig):  # 遞歸轉換子配置
+        return v.as_dict_jsonable()
+    if isinstance(v, Enum):  # 枚舉保存其值
+        return _to_jsonable(v.value)
+    if isinstance(v, (bool, str)) or v is None:
+        return v
+    # 數值子類與 numpy 標量一律轉為內建類型
+    if isinstance(v, np.bool_):
+        return bool(v)
+    if isinstance(v, (int, np.integer)):
+        return int(v)
+    if isinstance(v, (float, np.floating)):
+        return float(v)
+    if isinstance(v, (list, tuple)):
+        out = [_to_jsonable(x) for x in v]
+        if any(x is _SKIP for x in out):
+            return _SKIP
+        return out if isinstance(v, list) else tuple(out)
+    if isinstance(v, dict):
+        out = {}
+        for k, x in v.items():
+            x = _to_jsonable(x)
+            if type(k) not in _JSONABLE_TYPES or x is _SKIP:
+                return _SKIP
+            out[k] = x
+        return out
+    return _SKIP
@@ -9,7 +9,7 @@ from .unet import *
 from model.enc.choices import *
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BeatGANsAutoencConfig(BeatGANsUNetConfig):
     # number of style channels
     enc_out_channels: int = 512
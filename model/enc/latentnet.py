@@ -14,7 +14,7 @@ from .nn import timestep_embedding
 from .unet import *
 
 
-class LatentNetType(Enum):
+class LatentNetType(str, Enum):
     none = 'none'
     # injecting inputs into the hidden layers
     skip = 'skip'
@@ -24,7 +24,7 @@ class LatentNetReturn(NamedTuple):
     pred: torch.Tensor = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class MLPSkipNetConfig(BaseConfig):
     """
     default MLP for the latent DPM in the paper!
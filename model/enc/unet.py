@@ -15,7 +15,7 @@ from .nn import (conv_nd, linear, normalization, timestep_embedding,
                  torch_checkpoint, zero_module)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BeatGANsUNetConfig(BaseConfig):
     image_size: int = 64
     in_channels: int = 3
@@ -349,7 +349,7 @@ class Return(NamedTuple):
     pred: th.Tensor
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BeatGANsEncoderConfig(BaseConfig):
     image_size: int
     in_channels: int
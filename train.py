@@ -1,14 +1,8 @@
-from model.enc import encoder
-from model.enc import unet
-from templates import *
-from experiment import *
+if __name__ == "__main__":
+    # 延遲導入：只在實際訓練時才載入 torch 與模型模組
+    from templates import autoenc_72M
+    from experiment import train
 
-class identityConfig(unet.BeatGANsUNetConfig):
-    image_size = 128
-    channel_mult = (1, 1, 2, 2, 4, 4, 4)
-
-identityEncoder = encoder.BeatGANsAutoencModel(identityConfig)
-
-gpus = [0]
-conf = autoenc_72M()
-train(conf, gpus=gpus)
\ No newline at end of file
+    gpus = [0]
+    conf = autoenc_72M()
+    train(conf, gpus=gpus)